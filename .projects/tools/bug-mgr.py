@@ -14,19 +14,68 @@ Usage:
     python bug-mgr.py new --json '{"title": "Bug Title", "description": "...", "severity": "P1"}'
 """
 
-import argparse
-import json
 import os
 import re
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+# Patterns used on every bug operation, compiled once at import
+_TITLE_RE = re.compile(r'# BUG-\d+: (.+)')
+_SEVERITY_RE = re.compile(r'\*\*(P[0-2])\*\*')
+
+# Characters of a bug file read at a time when listing bugs; the title and
+# severity normally both fall in the first block
+_HEAD_SIZE = 2048
+
+# Starting content of BUGS.md when a project has none yet
+_BUGS_MD_INITIAL = """# BUGS
+
+A list of bugs for this project. Utilize the following bug levels:
+
+- [P0]: Breaking bug, something that causes the app not to function at all or cause further breaking behavior.
+- [P1]: A bug that is serious, but isn't stopping the app from functioning.
+- [P2]: A minor bug that is more annoying than anything
+
+## BUG List
+
+"""
+
+# Start of the placeholder text of each <REPLACE> block in _BUG-TEMPLATE.md,
+# and the bug field that fills it
+_TEMPLATE_SLOTS = (
+    ("A brief introduction to the bug:", "description"),
+    ("Select one severity", "severity"),
+    ("Context for this bug", "background"),
+    ("List OS, browser", "environment"),
+    ("1. Go to", "steps"),
+    ("Describe exactly what should happen", "expected"),
+    ("Describe exactly what does happen", "actual"),
+    ("Paste relevant log excerpts", "logs"),
+    ("If known, describe any workaround", "workaround"),
+    ("If you have suggestions", "proposed_fix"),
+)
+
+def _is_bug_file_name(name: str) -> bool:
+    """Check whether a file name has the BUG-<digits>.md form."""
+    return name.startswith("BUG-") and name.endswith(".md") and name[4:-3].isdecimal()
+
+
+def _expand_newlines(text: str) -> str:
+    """Turn literal \\n sequences (as typed on the command line) into newlines."""
+    return text.replace("\\n", "\n")
 
 
 class BugManager:
     """Manages BUGS.md and BUG files following project schema."""
     
+    # Severity section text for each severity level
+    _SEVERITY_TEXT = {
+        "P0": "**P0** – Critical: app crashes or core functionality is broken.",
+        "P1": "**P1** – Major: significant issue that degrades functionality but doesn't fully block the app.",
+        "P2": "**P2** – Minor: nuisance or cosmetic issue with low impact."
+    }
+    
     def __init__(self, project_root: str = None):
         """Initialize BugManager with project root directory.
         
@@ -37,12 +86,72 @@ class BugManager:
         self.bugs_file = self.project_root / "BUGS.md"
         self.bugs_dir = self.project_root / "BUGS"
         self.bug_template = self.bugs_dir / "_BUG-TEMPLATE.md"
+        # Local, git-ignored cache; it's checked against BUGS/ before use, so
+        # it doesn't need to follow branch switches
+        self._cache_dir = self.project_root / ".projects" / ".cache"
+        self._counter_file = self._cache_dir / "next_bug_id"
         
         # Ensure directories exist
         self.bugs_dir.mkdir(exist_ok=True)
         
         # Valid severity levels
-        self.valid_severities = ["P0", "P1", "P2"]
+        self.valid_severities = frozenset(self._SEVERITY_TEXT)
+        
+        # (mtime, content) of the BUG template and its parsed segments
+        self._template_cache: Optional[Tuple[float, str]] = None
+        self._template_segments: Optional[List[Tuple[str, Optional[str], str]]] = None
+        
+        # (mtime, content) of BUGS.md; mtime is None while a write is pending
+        self._bugs_md_cache: Optional[Tuple[Optional[float], str]] = None
+        self._defer_writes = False
+        
+        # (mtime, content) of bug files read by _load_bug_file, keyed by bug ID
+        self._bug_file_cache: Dict[str, Tuple[float, str]] = {}
+    
+    def __enter__(self) -> "BugManager":
+        """Defer BUGS.md writes until the block exits."""
+        self._defer_writes = True
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._defer_writes = False
+        self.flush()
+    
+    def flush(self) -> None:
+        """Write any pending BUGS.md changes to disk."""
+        if self._bugs_md_cache is not None and self._bugs_md_cache[0] is None:
+            content = self._bugs_md_cache[1]
+            self.bugs_file.write_bytes(content.encode("utf-8"))
+            self._bugs_md_cache = (self.bugs_file.stat().st_mtime, content)
+    
+    def _read_bugs_md(self) -> Optional[str]:
+        """Read BUGS.md, re-reading the file only when it has changed.
+        
+        Returns:
+            BUGS.md content, or None if it doesn't exist
+        """
+        if self._bugs_md_cache is not None and self._bugs_md_cache[0] is None:
+            return self._bugs_md_cache[1]
+        
+        try:
+            mtime = self.bugs_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        
+        if self._bugs_md_cache is None or self._bugs_md_cache[0] != mtime:
+            self._bugs_md_cache = (mtime, self.bugs_file.read_text(encoding="utf-8"))
+        
+        return self._bugs_md_cache[1]
+    
+    def _write_bugs_md(self, content: str) -> None:
+        """Update BUGS.md, writing it now unless writes are deferred.
+        
+        Args:
+            content: New BUGS.md content
+        """
+        self._bugs_md_cache = (None, content)
+        if not self._defer_writes:
+            self.flush()
         
     def _get_next_bug_id(self) -> str:
         """Get the next sequential bug ID.
@@ -50,16 +159,44 @@ class BugManager:
         Returns:
             String bug ID (e.g., "001", "002")
         """
-        existing_bugs = []
-        if self.bugs_dir.exists():
-            for bug_file in self.bugs_dir.glob("BUG-*.md"):
-                match = re.search(r'BUG-(\d+)\.md', bug_file.name)
-                if match:
-                    existing_bugs.append(int(match.group(1)))
-        
-        next_id = max(existing_bugs, default=0) + 1
+        # Trust the stored counter while it still lines up with the bug files
+        try:
+            next_id = int(self._counter_file.read_bytes())
+        except (OSError, ValueError):
+            next_id = 0
+        if next_id > 0 and not (self.bugs_dir / f"BUG-{next_id:03d}.md").exists() and (
+                next_id == 1 or (self.bugs_dir / f"BUG-{next_id - 1:03d}.md").exists()):
+            return f"{next_id:03d}"
+        
+        try:
+            with os.scandir(self.bugs_dir) as entries:
+                last_id = max(
+                    (int(entry.name[4:-3]) for entry in entries if _is_bug_file_name(entry.name)),
+                    default=0
+                )
+        except FileNotFoundError:
+            last_id = 0
+        
+        next_id = last_id + 1
         return f"{next_id:03d}"
     
+    def _save_next_bug_id(self, next_id: int) -> None:
+        """Store the next bug ID so the next new_bug needn't scan BUGS/ (best effort).
+        
+        Args:
+            next_id: Next bug ID as an integer
+        """
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            ignore_file = self._cache_dir / ".gitignore"
+            if not ignore_file.exists():
+                ignore_file.write_text("*\n")
+            tmp_file = self._counter_file.with_name(self._counter_file.name + ".tmp")
+            tmp_file.write_bytes(b"%d\n" % next_id)
+            os.replace(tmp_file, self._counter_file)
+        except OSError:
+            pass
+    
     def _load_bug_template(self) -> str:
         """Load the BUG template content.
         
@@ -69,10 +206,52 @@ class BugManager:
         Raises:
             FileNotFoundError: If template doesn't exist
         """
-        if not self.bug_template.exists():
+        try:
+            mtime = self.bug_template.stat().st_mtime
+        except FileNotFoundError:
             raise FileNotFoundError(f"Bug template not found: {self.bug_template}")
         
-        return self.bug_template.read_text()
+        if self._template_cache is None or self._template_cache[0] != mtime:
+            self._template_cache = (mtime, self.bug_template.read_text(encoding="utf-8"))
+            self._template_segments = None
+        
+        return self._template_cache[1]
+    
+    def _get_template_segments(self) -> List[Tuple[str, Optional[str], str]]:
+        """Get the parsed BUG template, parsing it only when it has changed.
+        
+        Returns:
+            Template segments as returned by _parse_bug_template
+        """
+        template = self._load_bug_template()
+        if self._template_segments is None:
+            self._template_segments = self._parse_bug_template(template)
+        return self._template_segments
+    
+    def _parse_bug_template(self, template: str) -> List[Tuple[str, Optional[str], str]]:
+        """Split the BUG template around its <REPLACE> blocks.
+        
+        Args:
+            template: Template content
+            
+        Returns:
+            List of (literal, slot, block) segments, where slot names the bug
+            field that replaces block (None if no field does)
+        """
+        segments = []
+        literal, *blocks = template.split("<REPLACE>")
+        for block in blocks:
+            placeholder, sep, rest = block.partition("</REPLACE>")
+            slot = None
+            if sep and placeholder.startswith("\n") and placeholder.endswith("\n"):
+                for prefix, name in _TEMPLATE_SLOTS:
+                    if placeholder.startswith(prefix, 1):
+                        slot = name
+                        break
+            segments.append((literal, slot, f"<REPLACE>{placeholder}{sep}"))
+            literal = rest
+        segments.append((literal, None, ""))
+        return segments
     
     def _create_bug_content(self, bug_id: str, title: str, description: str,
                            severity: str, background: str = "", environment: str = "",
@@ -97,54 +276,30 @@ class BugManager:
         Returns:
             Formatted bug content
         """
-        template = self._load_bug_template()
-        
-        # Replace template placeholders
-        content = template.replace(
-            "# BUG-nnn: Short bug summary",
-            f"# BUG-{bug_id}: {title}"
-        )
-        
-        # Replace description
-        content = re.sub(
-            r'<REPLACE>\nA brief introduction to the bug:.*?\n</REPLACE>',
-            description,
-            content,
-            flags=re.DOTALL
+        segments = self._get_template_segments()
+        title_line = f"# BUG-{bug_id}: {title}"
+        
+        values = {"description": _expand_newlines(description), "severity": self._SEVERITY_TEXT[severity]}
+        
+        # Only the optional fields that were given replace their block
+        optional = (
+            ("background", background),
+            ("environment", environment),
+            ("steps", steps),
+            ("expected", expected),
+            ("actual", actual),
+            ("logs", logs),
+            ("workaround", workaround),
+            ("proposed_fix", proposed_fix)
         )
+        values.update((slot, _expand_newlines(value)) for slot, value in optional if value)
         
-        # Replace severity
-        severity_text = f"**{severity}** – "
-        if severity == "P0":
-            severity_text += "Critical: app crashes or core functionality is broken."
-        elif severity == "P1":
-            severity_text += "Major: significant issue that degrades functionality but doesn't fully block the app."
-        elif severity == "P2":
-            severity_text += "Minor: nuisance or cosmetic issue with low impact."
-        
-        content = re.sub(
-            r'<REPLACE>\nSelect one severity.*?\n</REPLACE>',
-            severity_text,
-            content,
-            flags=re.DOTALL
+        # Blocks without a value keep the template text
+        content = "".join(
+            literal.replace("# BUG-nnn: Short bug summary", title_line) + values.get(slot, block)
+            for literal, slot, block in segments
         )
         
-        # Replace other sections
-        replacements = [
-            (r'<REPLACE>\nContext for this bug.*?\n</REPLACE>', background),
-            (r'<REPLACE>\nList OS, browser.*?\n</REPLACE>', environment),
-            (r'<REPLACE>\n1\. Go to.*?\n</REPLACE>', steps),
-            (r'<REPLACE>\nDescribe exactly what should happen.*?\n</REPLACE>', expected),
-            (r'<REPLACE>\nDescribe exactly what does happen.*?\n</REPLACE>', actual),
-            (r'<REPLACE>\nPaste relevant log excerpts.*?\n</REPLACE>', logs),
-            (r'<REPLACE>\nIf known, describe any workaround.*?\n</REPLACE>', workaround),
-            (r'<REPLACE>\nIf you have suggestions.*?\n</REPLACE>', proposed_fix)
-        ]
-        
-        for pattern, replacement in replacements:
-            if replacement:
-                content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-        
         return content
     
     def _update_bugs_md(self, bug_id: str, title: str, severity: str, action: str = "add") -> None:
@@ -156,44 +311,30 @@ class BugManager:
             severity: Bug severity
             action: "add" or "resolve"
         """
-        if not self.bugs_file.exists():
+        content = self._read_bugs_md()
+        if content is None:
             # Create BUGS.md if it doesn't exist
-            initial_content = """# BUGS
-
-A list of bugs for this project. Utilize the following bug levels:
-
-- [P0]: Breaking bug, something that causes the app not to function at all or cause further breaking behavior.
-- [P1]: A bug that is serious, but isn't stopping the app from functioning.
-- [P2]: A minor bug that is more annoying than anything
-
-## BUG List
-
-"""
-            self.bugs_file.write_text(initial_content)
-        
-        content = self.bugs_file.read_text()
+            content = _BUGS_MD_INITIAL
         
         if action == "add":
             # Add new bug entry
             bug_entry = f"- [ ] BUG-{bug_id}: [{severity}] {title}\n"
             
-            if "## BUG List" in content:
+            header = "## BUG List\n\n"
+            idx = content.find(header)
+            if idx != -1:
                 # Insert after BUG List header
-                content = content.replace(
-                    "## BUG List\n\n",
-                    f"## BUG List\n\n{bug_entry}"
-                )
+                idx += len(header)
+                content = content[:idx] + bug_entry + content[idx:]
             else:
                 # Append to end
                 content += f"\n{bug_entry}"
         
         elif action == "resolve":
             # Mark bug as resolved
-            pattern = f"- \\[ \\] BUG-{bug_id}:"
-            replacement = f"- [x] BUG-{bug_id}:"
-            content = re.sub(pattern, replacement, content)
+            content = content.replace(f"- [ ] BUG-{bug_id}:", f"- [x] BUG-{bug_id}:", 1)
         
-        self.bugs_file.write_text(content)
+        self._write_bugs_md(content)
     
     def _load_bug_file(self, bug_id: str) -> Tuple[Path, str]:
         """Load existing bug file.
@@ -208,10 +349,18 @@ A list of bugs for this project. Utilize the following bug levels:
             FileNotFoundError: If bug file doesn't exist
         """
         bug_file = self.bugs_dir / f"BUG-{bug_id}.md"
-        if not bug_file.exists():
+        try:
+            mtime = bug_file.stat().st_mtime
+        except FileNotFoundError:
             raise FileNotFoundError(f"Bug file not found: {bug_file}")
         
-        return bug_file, bug_file.read_text()
+        cached = self._bug_file_cache.get(bug_id)
+        if cached is not None and cached[0] == mtime:
+            return bug_file, cached[1]
+        
+        content = bug_file.read_text(encoding="utf-8")
+        self._bug_file_cache[bug_id] = (mtime, content)
+        return bug_file, content
     
     def _check_bug_resolution(self, content: str) -> Tuple[bool, List[str]]:
         """Check if bug cleanup items are completed.
@@ -223,25 +372,27 @@ A list of bugs for this project. Utilize the following bug levels:
             Tuple of (is_resolved, missing_items)
         """
         # Find cleanup section
-        cleanup_match = re.search(r'## Cleanup\n\n(.*?)(?=\n## |$)', content, re.DOTALL)
-        if not cleanup_match:
+        header = "## Cleanup\n\n"
+        start = content.find(header)
+        if start == -1:
             return False, ["No cleanup section found"]
         
-        cleanup_content = cleanup_match.group(1)
+        # Section body runs up to the next heading
+        body_start = start + len(header)
+        end = content.find("\n## ", body_start)
         
-        # Check for incomplete items
-        incomplete_items = re.findall(r'- \[ \] (.+)', cleanup_content)
+        # Collect incomplete items from the section lines
+        missing_items = []
+        for line in content[body_start:end if end != -1 else None].split("\n"):
+            idx = line.find("- [ ] ")
+            if idx != -1 and idx + 6 < len(line):
+                missing_items.append(line[idx + 6:])
         
         # Check for commit link
-        has_commit_link = "git.y37.space" in content and "https://" in content
-        
-        missing_items = []
-        if incomplete_items:
-            missing_items.extend(incomplete_items)
-        if not has_commit_link:
+        if "git.y37.space" not in content or "https://" not in content:
             missing_items.append("Missing commit link in Final Comments")
         
-        return len(missing_items) == 0, missing_items
+        return not missing_items, missing_items
     
     def new_bug(self, title: str, description: str, severity: str,
                 background: str = "", environment: str = "", steps: str = "",
@@ -285,7 +436,7 @@ A list of bugs for this project. Utilize the following bug levels:
             raise ValueError("Title and description are required")
         
         if severity not in self.valid_severities:
-            raise ValueError(f"Severity must be one of: {', '.join(self.valid_severities)}")
+            raise ValueError(f"Severity must be one of: {', '.join(sorted(self.valid_severities))}")
         
         # Get next bug ID
         bug_id = self._get_next_bug_id()
@@ -298,10 +449,11 @@ A list of bugs for this project. Utilize the following bug levels:
         
         # Write bug file
         bug_file = self.bugs_dir / f"BUG-{bug_id}.md"
-        bug_file.write_text(bug_content)
+        bug_file.write_bytes(bug_content.encode("utf-8"))
         
         # Update BUGS.md
         self._update_bugs_md(bug_id, title, severity, "add")
+        self._save_next_bug_id(int(bug_id) + 1)
         
         return bug_id
     
@@ -341,25 +493,32 @@ A list of bugs for this project. Utilize the following bug levels:
         bug_file, content = self._load_bug_file(bug_id)
         
         # Update sections
-        updates = [
-            ("Background", background),
-            ("Environment", environment),
-            ("Steps to Reproduce", steps),
-            ("Expected Behavior", expected),
-            ("Actual Behavior", actual),
-            ("Logs & Screenshots", logs),
-            ("Temporary Workaround", workaround),
-            ("Proposed Fix", proposed_fix)
-        ]
-        
-        for section, new_content in updates:
-            if new_content:
-                pattern = f'(## {section}\n\n).*?(?=\n## |$)'
-                replacement = f'\\1{new_content}\n'
-                content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+        updates = {
+            "Background": background,
+            "Environment": environment,
+            "Steps to Reproduce": steps,
+            "Expected Behavior": expected,
+            "Actual Behavior": actual,
+            "Logs & Screenshots": logs,
+            "Temporary Workaround": workaround,
+            "Proposed Fix": proposed_fix
+        }
+        
+        # Split once on the section headings and replace the bodies in place
+        parts = content.split("\n## ")
+        last = len(parts) - 1
+        for i in range(1, len(parts)):
+            section, sep, body = parts[i].partition("\n\n")
+            new_content = updates.get(section)
+            if sep and new_content:
+                # A final section keeps the file's trailing newline
+                trailing = "\n" if i == last and body.endswith("\n") else ""
+                parts[i] = f"{section}\n\n{_expand_newlines(new_content)}\n{trailing}"
+        content = "\n## ".join(parts)
         
         # Write updated content
-        bug_file.write_text(content)
+        bug_file.write_bytes(content.encode("utf-8"))
+        self._bug_file_cache.pop(bug_id, None)
         
         return True
     
@@ -397,46 +556,98 @@ A list of bugs for this project. Utilize the following bug levels:
         """
         bugs = []
         
-        # Read BUGS.md to get bug status
-        bugs_content = ""
-        if self.bugs_file.exists():
-            bugs_content = self.bugs_file.read_text()
+        # Read BUGS.md once to get the IDs of resolved bugs
+        resolved_ids = set()
+        for line in (self._read_bugs_md() or "").splitlines():
+            if line.startswith("- [x] BUG-"):
+                resolved_ids.add(line[10:].partition(":")[0])
         
         # Find all bug files
-        if self.bugs_dir.exists():
-            for bug_file in sorted(self.bugs_dir.glob("BUG-*.md")):
-                match = re.search(r'BUG-(\d+)\.md', bug_file.name)
-                if match:
-                    bug_id = match.group(1)
-                    
-                    # Get title and severity from file
-                    content = bug_file.read_text()
-                    title_match = re.search(r'# BUG-\d+: (.+)', content)
-                    title = title_match.group(1) if title_match else "Unknown"
-                    
-                    severity_match = re.search(r'\*\*(P[0-2])\*\*', content)
-                    severity = severity_match.group(1) if severity_match else "Unknown"
-                    
-                    # Check status in BUGS.md
-                    status = "open"
-                    if f"- [x] BUG-{bug_id}:" in bugs_content:
-                        status = "resolved"
-                    elif f"- [ ] BUG-{bug_id}:" in bugs_content:
-                        status = "open"
-                    
-                    bugs.append({
-                        "id": bug_id,
-                        "title": title,
-                        "severity": severity,
-                        "status": status,
-                        "file": str(bug_file)
-                    })
+        try:
+            with os.scandir(self.bugs_dir) as entries:
+                bug_files = sorted(
+                    (entry.name[4:-3], entry.path) for entry in entries if _is_bug_file_name(entry.name)
+                )
+        except FileNotFoundError:
+            bug_files = []
+        
+        for bug_id, bug_path in bug_files:
+            # Get title and severity from the head of the file
+            with open(bug_path, encoding="utf-8") as f:
+                head = f.read(_HEAD_SIZE)
+                title_match = _TITLE_RE.search(head)
+                severity_match = _SEVERITY_RE.search(head)
+                # Keep reading only if the severity is further down
+                while severity_match is None:
+                    chunk = f.read(_HEAD_SIZE)
+                    if not chunk:
+                        break
+                    head = head[-5:] + chunk
+                    severity_match = _SEVERITY_RE.search(head)
+            
+            title = title_match.group(1) if title_match else "Unknown"
+            severity = severity_match.group(1) if severity_match else "Unknown"
+            
+            status = "resolved" if bug_id in resolved_ids else "open"
+            
+            bugs.append({
+                "id": bug_id,
+                "title": title,
+                "severity": severity,
+                "status": status,
+                "file": bug_path
+            })
         
         return bugs
 
 
+def _json_loads(data: str) -> Any:
+    """Decode a --json argument, using orjson if it is available.
+    
+    The JSON modules are only imported here since most invocations don't
+    pass --json.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _print_bugs(manager: BugManager) -> None:
+    """Print all bugs with their status.
+    
+    Args:
+        manager: BugManager to list bugs from
+    """
+    bugs = manager.list_bugs()
+    if bugs:
+        print("Bugs:")
+        for bug in bugs:
+            status_icon = "✓" if bug["status"] == "resolved" else "○"
+            print(f"  {status_icon} BUG-{bug['id']}: [{bug['severity']}] {bug['title']}")
+    else:
+        print("No bugs found")
+
+
 def main():
     """Main entry point for the bug manager tool."""
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    
+    # "list" takes no arguments, so it doesn't need a parser at all
+    if command == "list" and len(sys.argv) == 2:
+        manager = BugManager()
+        try:
+            _print_bugs(manager)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    # Only needed once a command line has to be parsed
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Manage BUGS.md and BUG files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -459,43 +670,46 @@ Examples:
         """
     )
     
-    # Add subcommands
+    # Add subcommands; only the one being run gets its arguments
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
     # New bug command
     new_parser = subparsers.add_parser("new", help="Create a new bug report")
-    new_parser.add_argument("--title", help="Bug title")
-    new_parser.add_argument("--description", help="Bug description")
-    new_parser.add_argument("--severity", choices=["P0", "P1", "P2"], help="Bug severity")
-    new_parser.add_argument("--background", help="Background context", default="")
-    new_parser.add_argument("--environment", help="Environment details", default="")
-    new_parser.add_argument("--steps", help="Steps to reproduce", default="")
-    new_parser.add_argument("--expected", help="Expected behavior", default="")
-    new_parser.add_argument("--actual", help="Actual behavior", default="")
-    new_parser.add_argument("--logs", help="Logs and screenshots", default="")
-    new_parser.add_argument("--workaround", help="Temporary workaround", default="")
-    new_parser.add_argument("--proposed-fix", help="Proposed fix", default="")
-    new_parser.add_argument("--json", help="JSON data for bug creation")
+    if command == "new":
+        new_parser.add_argument("--title", help="Bug title")
+        new_parser.add_argument("--description", help="Bug description")
+        new_parser.add_argument("--severity", choices=["P0", "P1", "P2"], help="Bug severity")
+        new_parser.add_argument("--background", help="Background context", default="")
+        new_parser.add_argument("--environment", help="Environment details", default="")
+        new_parser.add_argument("--steps", help="Steps to reproduce", default="")
+        new_parser.add_argument("--expected", help="Expected behavior", default="")
+        new_parser.add_argument("--actual", help="Actual behavior", default="")
+        new_parser.add_argument("--logs", help="Logs and screenshots", default="")
+        new_parser.add_argument("--workaround", help="Temporary workaround", default="")
+        new_parser.add_argument("--proposed-fix", help="Proposed fix", default="")
+        new_parser.add_argument("--json", help="JSON data for bug creation")
     
     # Update bug command
     update_parser = subparsers.add_parser("update", help="Update an existing bug report")
-    update_parser.add_argument("--bug-id", required=True, help="Bug ID to update")
-    update_parser.add_argument("--background", help="Updated background context")
-    update_parser.add_argument("--environment", help="Updated environment details")
-    update_parser.add_argument("--steps", help="Updated steps to reproduce")
-    update_parser.add_argument("--expected", help="Updated expected behavior")
-    update_parser.add_argument("--actual", help="Updated actual behavior")
-    update_parser.add_argument("--logs", help="Updated logs and screenshots")
-    update_parser.add_argument("--workaround", help="Updated temporary workaround")
-    update_parser.add_argument("--proposed-fix", help="Updated proposed fix")
-    update_parser.add_argument("--json", help="JSON data for bug update")
+    if command == "update":
+        update_parser.add_argument("--bug-id", required=True, help="Bug ID to update")
+        update_parser.add_argument("--background", help="Updated background context")
+        update_parser.add_argument("--environment", help="Updated environment details")
+        update_parser.add_argument("--steps", help="Updated steps to reproduce")
+        update_parser.add_argument("--expected", help="Updated expected behavior")
+        update_parser.add_argument("--actual", help="Updated actual behavior")
+        update_parser.add_argument("--logs", help="Updated logs and screenshots")
+        update_parser.add_argument("--workaround", help="Updated temporary workaround")
+        update_parser.add_argument("--proposed-fix", help="Updated proposed fix")
+        update_parser.add_argument("--json", help="JSON data for bug update")
     
     # Resolve bug command
     resolve_parser = subparsers.add_parser("resolve", help="Mark a bug as resolved")
-    resolve_parser.add_argument("--bug-id", required=True, help="Bug ID to resolve")
+    if command == "resolve":
+        resolve_parser.add_argument("--bug-id", required=True, help="Bug ID to resolve")
     
     # List bugs command
-    list_parser = subparsers.add_parser("list", help="List all bugs")
+    subparsers.add_parser("list", help="List all bugs")
     
     # Parse arguments
     args = parser.parse_args()
@@ -512,7 +726,7 @@ Examples:
             # Parse JSON if provided
             json_data = None
             if args.json:
-                json_data = json.loads(args.json)
+                json_data = _json_loads(args.json)
             
             bug_id = manager.new_bug(
                 title=args.title or "",
@@ -534,7 +748,7 @@ Examples:
             # Parse JSON if provided
             json_data = None
             if args.json:
-                json_data = json.loads(args.json)
+                json_data = _json_loads(args.json)
             
             success = manager.update_bug(
                 bug_id=args.bug_id,
@@ -557,14 +771,7 @@ Examples:
                 print(f"Resolved bug BUG-{args.bug_id}")
         
         elif args.command == "list":
-            bugs = manager.list_bugs()
-            if bugs:
-                print("Bugs:")
-                for bug in bugs:
-                    status_icon = "✓" if bug["status"] == "resolved" else "○"
-                    print(f"  {status_icon} BUG-{bug['id']}: [{bug['severity']}] {bug['title']}")
-            else:
-                print("No bugs found")
+            _print_bugs(manager)
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -14,17 +14,139 @@ Usage:
 """
 
 import argparse
+import hashlib
+import http.client
+import importlib.util
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
-import urllib.request
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Try to import yaml (preferring the libyaml loader), fallback to basic parsing if not available
+try:
+    import yaml
+    YAML_AVAILABLE = True
+    # project.yaml values are used as strings (e.g. in API URLs), so load
+    # without implicit typing; an alias like 'on' or '1234' stays a string
+    _YAML_LOADER = getattr(yaml, 'CBaseLoader', yaml.BaseLoader)
+except ImportError:
+    YAML_AVAILABLE = False
+
+# Use orjson for API bodies when it is installed; it works on bytes directly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Patterns used when analyzing logs, compiled once at import
+_MODULE_NOT_FOUND_RE = re.compile(r"ModuleNotFoundError: No module named '([^']+)'")
+
+# Upper bound on step logs fetched concurrently by get_build_logs
+_MAX_LOG_FETCHES = 8
+
+# wait_for_build polling: start short, back off by _POLL_BACKOFF up to
+# _POLL_MAX_DELAY, and wait at least _POLL_RUNNING_DELAY once a build runs
+_POLL_INITIAL_DELAY = 2.0
+_POLL_RUNNING_DELAY = 15.0
+_POLL_MAX_DELAY = 30.0
+_POLL_BACKOFF = 1.5
+
+# Only the tail of each step log is scanned; the failing command's output ends it
+_ANALYSIS_TAIL_CHARS = 8192
+
+# Step states whose logs can no longer change and are safe to cache on disk
+_FINISHED_STEP_STATES = frozenset({'success', 'failure', 'error', 'killed'})
+
+# Issue description templates, filled in with str.format
+_FAILURE_ISSUE_TEMPLATE = """## Build Failure Report
+
+**Status:** {status}
+**Build Number:** #{build_number}
+**Commit SHA:** {commit_sha}
+**Branch:** {branch}
+**Started:** {started}
+**Finished:** {finished}
+
+## Commit Details
+**Message:** {message}
+**Author:** {author}
+
+## Build Steps Status{step_lines}{failed_details}
+
+## Next Steps
+1. Review the build logs above for specific error details
+2. Identify the root cause of the failure
+3. Apply appropriate fixes
+4. Re-run the build to verify the fix
+
+## Build URL
+[View full build details]({build_url})
+
+---
+*Auto-created by CI Monitor on build failure*"""
+
+_BUG_REPORT_ISSUE_TEMPLATE = """## Problem Description
+{description}
+
+## Build Context
+- **Build Step:** {step}
+- **Issue Type:** {type}
+- **Build Number:** #{build_number}
+- **Commit:** {commit}
+
+## Suggested Fix
+{fix}
+
+## Reproduction Steps
+1. Make a commit that triggers CI
+2. Wait for build to reach the '{step}' step
+3. Observe the failure pattern
+
+## Expected Behavior
+The '{step}' step should complete successfully
+
+## Actual Behavior
+The '{step}' step fails with: {description}
+
+---
+*Auto-created by CI Monitor issue analysis*"""
+
+_STEP_STATUS_ICONS = {'success': "✅", 'failure': "❌"}
+
+
+def _json_dumps(data) -> bytes:
+    """Encode an API request body as UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Decode a UTF-8 JSON API response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _ssh_git_url_to_https(line: str) -> str:
+    """Rewrite a git@host:owner/repo.git URL in a config line to https://host/owner/repo."""
+    head, at, url = line.partition('git@')
+    host, colon, path = url.partition(':')
+    owner, slash, repo = path.partition('/')
+    name, dot, tail = repo.partition('.')
+    if at and host and colon and owner and slash and name and tail.startswith('git'):
+        return f"{head}https://{host}/{owner}/{name}{tail[3:]}"
+    return line
+
 
 class CIMonitor:
     """Monitors and manages Woodpecker CI builds with Issues integration."""
@@ -35,6 +157,7 @@ class CIMonitor:
         self.projects_dir = self.project_root / ".projects"
         self.tools_dir = self.projects_dir / "tools"
         self.env_file = self.projects_dir / ".env"
+        self._log_cache_dir = self.projects_dir / ".cache" / "ci-logs"
         self.project_yaml = self.project_root / "project.yaml"
         
         # Load environment and project configuration
@@ -44,10 +167,20 @@ class CIMonitor:
         # API configuration
         self.woodpecker_api_key = self.env_vars.get("MAYA_WOODPECKER_API_KEY")
         self.woodpecker_base_url = "https://ci.y37.space"
+        self._auth_headers = {"Authorization": f"Bearer {self.woodpecker_api_key}"}
+        self._repo_info: Optional[Dict] = None
+        
+        # Idle keep-alive API connections by host, shared by all threads
+        self._idle_connections: Dict[str, List[http.client.HTTPSConnection]] = {}
+        self._connections_lock = threading.Lock()
         
         # Issues integration
         self.issues_enabled = True
         self.issue_mgr_path = self.tools_dir / "issue-mgr.py"
+        self._issue_manager = None
+        
+        # DOCS/mkdocs.yml as (path, content), shared by the _fix_mkdocs_* methods
+        self._mkdocs_cache: Optional[Tuple[Path, str]] = None
         
         if not self.woodpecker_api_key:
             raise ValueError("MAYA_WOODPECKER_API_KEY not found in .projects/.env")
@@ -72,12 +205,23 @@ class CIMonitor:
         
         return env_vars
     
-    def _load_project_config(self) -> Dict[str, str]:
+    def _load_project_config(self) -> Dict:
         """Load project configuration from project.yaml."""
         config = {}
         if not self.project_yaml.exists():
             return config
         
+        if YAML_AVAILABLE:
+            try:
+                with open(self.project_yaml, 'r') as f:
+                    project_data = yaml.load(f, Loader=_YAML_LOADER)
+                return project_data if isinstance(project_data, dict) else config
+            except yaml.YAMLError:
+                # e.g. an unquoted description containing ': '; the line
+                # parser below still handles that
+                pass
+        
+        # Basic YAML parsing for simple key: value format
         with open(self.project_yaml, 'r') as f:
             for line in f:
                 line = line.strip()
@@ -89,37 +233,110 @@ class CIMonitor:
     
     def _make_api_request(self, url: str, method: str = "GET", data: Optional[Dict] = None) -> Dict:
         """Make an API request to Woodpecker CI."""
-        headers = {"Authorization": f"Bearer {self.woodpecker_api_key}"}
+        if not data:
+            return self._request(url, method, None, self._auth_headers)
+        headers = {**self._auth_headers, "Content-Type": "application/json"}
+        return self._request(url, method, _json_dumps(data), headers)
+    
+    def _get(self, url: str) -> Dict:
+        """GET a Woodpecker CI API URL; the common case, with no request body to build."""
+        return self._request(url, "GET", None, self._auth_headers)
+    
+    def _request(self, url: str, method: str, body: Optional[bytes], headers: Dict[str, str]) -> Dict:
+        """Send an API request and decode its JSON response.
         
-        if data:
-            headers["Content-Type"] = "application/json"
+        Raises:
+            ValueError: If the request fails or the response is an error
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
         
-        request_data = None
-        if data:
-            request_data = json.dumps(data).encode('utf-8')
+        try:
+            status, response_data = self._send_request(parts.netloc, method, path, body, headers)
+        except (http.client.HTTPException, OSError) as e:
+            raise ValueError(f"API request failed: {e}")
         
-        req = urllib.request.Request(url, data=request_data, headers=headers, method=method)
+        if status >= 400:
+            try:
+                error_body = response_data.decode('utf-8')
+                error_data = json.loads(error_body)
+                error_msg = error_data.get('message', error_body)
+            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                error_msg = f"HTTP Error {status}: {http.client.responses.get(status, '')}"
+            raise ValueError(f"API request failed ({status}): {error_msg}")
+        
+        if response_data:
+            try:
+                return _json_loads(response_data)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise ValueError(f"API request failed: {e}")
+        return {}
+    
+    def _acquire_connection(self, host: str) -> http.client.HTTPSConnection:
+        """Take an idle keep-alive connection for host, or open a new one."""
+        with self._connections_lock:
+            idle = self._idle_connections.get(host)
+            if idle:
+                return idle.pop()
+        return http.client.HTTPSConnection(host)
+    
+    def _release_connection(self, host: str, conn: http.client.HTTPSConnection) -> None:
+        """Return a connection to the idle pool, closing it if the pool is full."""
+        with self._connections_lock:
+            idle = self._idle_connections.setdefault(host, [])
+            if len(idle) < _MAX_LOG_FETCHES:
+                idle.append(conn)
+                return
+        conn.close()
+    
+    def _send_request(self, host: str, method: str, path: str, body: Optional[bytes],
+                      headers: Dict[str, str]) -> Tuple[int, bytes]:
+        """Send a request over a pooled keep-alive connection for host.
         
-        try:
-            with urllib.request.urlopen(req) as response:
-                response_data = response.read().decode('utf-8')
-                if response_data:
-                    return json.loads(response_data)
-                return {}
-        except Exception as e:
-            if hasattr(e, 'code') and hasattr(e, 'read'):
-                try:
-                    error_body = e.read().decode('utf-8')
-                    error_data = json.loads(error_body)
-                    error_msg = error_data.get('message', error_body)
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    error_msg = str(e)
-                raise ValueError(f"API request failed ({e.code}): {error_msg}")
+        The server may drop an idle keep-alive connection between calls, so a
+        GET that hits a stale connection is retried once on a fresh one. Other
+        methods aren't retried, since the server may have acted on the first
+        attempt. A connection that fails is closed rather than pooled.
+        
+        Returns:
+            Tuple of (status code, raw response body)
+        """
+        conn = self._acquire_connection(host)
+        for attempt in range(2):
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                response_data = response.read()
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionResetError, BrokenPipeError):
+                # closed connections reconnect on their next request
+                conn.close()
+                if attempt or method != "GET":
+                    raise
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
             else:
-                raise ValueError(f"API request failed: {e}")
+                self._release_connection(host, conn)
+                return response.status, response_data
+    
+    def close(self) -> None:
+        """Close all idle keep-alive API connections."""
+        with self._connections_lock:
+            for idle in self._idle_connections.values():
+                for conn in idle:
+                    conn.close()
+            self._idle_connections.clear()
     
     def get_repository_info(self) -> Optional[Dict]:
-        """Get repository information from Woodpecker CI."""
+        """Get repository information from Woodpecker CI.
+        
+        The result is cached for the lifetime of the monitor once the
+        repository has been found.
+        """
+        if self._repo_info is not None:
+            return self._repo_info
+        
         project_alias = self.project_config.get('project_alias')
         if not project_alias:
             print("No project_alias found in project.yaml")
@@ -131,9 +348,10 @@ class CIMonitor:
         repos_url = f"{self.woodpecker_base_url}/api/user/repos"
         
         try:
-            repos = self._make_api_request(repos_url)
+            repos = self._get(repos_url)
             for repo in repos:
                 if repo.get('full_name') == repo_name:
+                    self._repo_info = repo
                     return repo
         except ValueError as e:
             print(f"Error getting repository info: {e}")
@@ -145,7 +363,7 @@ class CIMonitor:
         builds_url = f"{self.woodpecker_base_url}/api/repos/{repo_id}/builds"
         
         try:
-            builds = self._make_api_request(builds_url)
+            builds = self._get(builds_url)
             if builds:
                 return builds[0]  # Latest build is first
         except ValueError as e:
@@ -158,7 +376,7 @@ class CIMonitor:
         builds_url = f"{self.woodpecker_base_url}/api/repos/{repo_id}/builds"
         
         try:
-            builds = self._make_api_request(builds_url)
+            builds = self._get(builds_url)
             for build in builds:
                 if build.get('commit', {}).get('sha', '').startswith(commit_sha):
                     return build
@@ -167,6 +385,52 @@ class CIMonitor:
         
         return None
     
+    def _write_log_cache(self, cache_file: Path, log_text: str):
+        """Atomically store a step log in the on-disk cache (best effort)."""
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            self._log_cache_dir.mkdir(parents=True, exist_ok=True)
+            # keep cached logs out of git, even in projects whose .gitignore
+            # predates the cache; commit_and_push_fixes stages with 'add -A'
+            ignore_file = self._log_cache_dir.parent / ".gitignore"
+            if not ignore_file.exists():
+                ignore_file.write_text("*\n")
+            tmp_file.write_bytes(log_text.encode('utf-8'))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    
+    def _fetch_step_log(self, repo_id: int, build_number: int, step_id: int,
+                        finished: bool = False) -> str:
+        """Fetch the log text of a single build step.
+        
+        Logs of finished steps are cached under .projects/.cache/ci-logs so
+        re-analysing the same build doesn't download them again.
+        """
+        cache_file = None
+        if finished:
+            key = hashlib.sha1(f"{repo_id}:{build_number}:{step_id}".encode('utf-8')).hexdigest()
+            cache_file = self._log_cache_dir / key
+            try:
+                return cache_file.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                pass
+        
+        log_url = f"{self.woodpecker_base_url}/api/repos/{repo_id}/builds/{build_number}/logs/{step_id}"
+        try:
+            log_response = self._get(log_url)
+        except ValueError:
+            return "Failed to retrieve logs"
+        
+        if isinstance(log_response, list):
+            log_text = '\n'.join([entry.get('data', '') for entry in log_response])
+        else:
+            log_text = str(log_response)
+        
+        if cache_file is not None:
+            self._write_log_cache(cache_file, log_text)
+        return log_text
+    
     def get_build_logs(self, repo_id: int, build_number: int) -> Dict[str, str]:
         """Get logs for all steps in a build."""
         logs = {}
@@ -175,26 +439,24 @@ class CIMonitor:
         build_url = f"{self.woodpecker_base_url}/api/repos/{repo_id}/builds/{build_number}"
         
         try:
-            build = self._make_api_request(build_url)
+            build = self._get(build_url)
             workflows = build.get('workflows', [])
             
-            for workflow in workflows:
-                children = workflow.get('children', [])
-                for step in children:
-                    step_id = step.get('id')
-                    step_name = step.get('name', 'unknown')
-                    
-                    if step_id:
-                        log_url = f"{self.woodpecker_base_url}/api/repos/{repo_id}/builds/{build_number}/logs/{step_id}"
-                        try:
-                            log_response = self._make_api_request(log_url)
-                            if isinstance(log_response, list):
-                                log_text = '\\n'.join([entry.get('data', '') for entry in log_response])
-                            else:
-                                log_text = str(log_response)
-                            logs[step_name] = log_text
-                        except ValueError:
-                            logs[step_name] = "Failed to retrieve logs"
+            steps = [
+                (step.get('id'), step.get('name', 'unknown'), step.get('state') in _FINISHED_STEP_STATES)
+                for workflow in workflows
+                for step in workflow.get('children', [])
+                if step.get('id')
+            ]
+            
+            # Step logs are independent, so fetch them concurrently
+            if steps:
+                with ThreadPoolExecutor(max_workers=min(_MAX_LOG_FETCHES, len(steps))) as executor:
+                    log_texts = executor.map(
+                        lambda step: self._fetch_step_log(repo_id, build_number, step[0], step[2]), steps
+                    )
+                    for (_, step_name, _), log_text in zip(steps, log_texts):
+                        logs[step_name] = log_text
             
         except ValueError as e:
             print(f"Error getting build logs: {e}")
@@ -208,9 +470,11 @@ class CIMonitor:
         for step_name, log_content in logs.items():
             if not log_content:
                 continue
+            log_content = log_content[-_ANALYSIS_TAIL_CHARS:]
+            step_lower = step_name.lower()
             
-            # Check for MkDocs issues
-            if 'mkdocs' in step_name.lower() or 'docs' in step_name.lower():
+            # Check for MkDocs issues ('docs' also matches 'mkdocs')
+            if 'docs' in step_lower:
                 if "docs_dir should not be the parent directory" in log_content:
                     issues.append({
                         'step': step_name,
@@ -236,7 +500,7 @@ class CIMonitor:
                     })
             
             # Check for Python linting issues
-            if 'lint' in step_name.lower():
+            if 'lint' in step_lower:
                 if "command not found: black" in log_content:
                     issues.append({
                         'step': step_name,
@@ -246,7 +510,7 @@ class CIMonitor:
                     })
             
             # Check for test failures
-            if 'test' in step_name.lower():
+            if 'test' in step_lower:
                 if "No tests ran" in log_content or "no tests directory found" in log_content:
                     issues.append({
                         'step': step_name,
@@ -257,7 +521,7 @@ class CIMonitor:
             
             # Check for general Python errors
             if "ModuleNotFoundError" in log_content:
-                module_match = re.search(r"ModuleNotFoundError: No module named '([^']+)'", log_content)
+                module_match = _MODULE_NOT_FOUND_RE.search(log_content)
                 if module_match:
                     module_name = module_match.group(1)
                     issues.append({
@@ -276,6 +540,7 @@ class CIMonitor:
             return True
         
         fixed_any = False
+        self._mkdocs_cache = None
         
         for issue in issues:
             issue_type = issue['type']
@@ -303,19 +568,34 @@ class CIMonitor:
         
         return fixed_any
     
+    def _load_mkdocs_yml(self) -> Optional[Tuple[Path, str]]:
+        """Return (path, content) of DOCS/mkdocs.yml, reading it at most once per fix run."""
+        if self._mkdocs_cache is None:
+            mkdocs_yml = self.project_root / "DOCS" / "mkdocs.yml"
+            try:
+                with open(mkdocs_yml, 'r') as f:
+                    self._mkdocs_cache = (mkdocs_yml, f.read())
+            except FileNotFoundError:
+                return None
+        return self._mkdocs_cache
+    
+    def _save_mkdocs_yml(self, content: str):
+        """Atomically write DOCS/mkdocs.yml and keep the cached copy in sync."""
+        mkdocs_yml = self._mkdocs_cache[0]
+        tmp_file = mkdocs_yml.with_suffix('.yml.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(content)
+        os.replace(tmp_file, mkdocs_yml)
+        self._mkdocs_cache = (mkdocs_yml, content)
+    
     def _fix_mkdocs_directory_structure(self) -> bool:
         """Fix MkDocs directory structure issues."""
-        docs_dir = self.project_root / "DOCS"
-        if not docs_dir.exists():
+        mkdocs = self._load_mkdocs_yml()
+        if mkdocs is None:
             return False
         
-        mkdocs_yml = docs_dir / "mkdocs.yml"
-        if not mkdocs_yml.exists():
-            return False
-        
-        # Read current config
-        with open(mkdocs_yml, 'r') as f:
-            content = f.read()
+        mkdocs_yml, content = mkdocs
+        docs_dir = mkdocs_yml.parent
         
         # Fix docs_dir configuration
         if "docs_dir: ." in content:
@@ -329,10 +609,7 @@ class CIMonitor:
                     md_file.rename(docs_subdir / md_file.name)
             
             # Update configuration
-            content = content.replace("docs_dir: .", "docs_dir: docs")
-            
-            with open(mkdocs_yml, 'w') as f:
-                f.write(content)
+            self._save_mkdocs_yml(content.replace("docs_dir: .", "docs_dir: docs"))
             
             return True
         
@@ -340,40 +617,34 @@ class CIMonitor:
     
     def _fix_mkdocs_url_format(self) -> bool:
         """Fix MkDocs URL format issues."""
-        docs_dir = self.project_root / "DOCS"
-        if not docs_dir.exists():
+        mkdocs = self._load_mkdocs_yml()
+        if mkdocs is None:
             return False
         
-        mkdocs_yml = docs_dir / "mkdocs.yml"
-        if not mkdocs_yml.exists():
-            return False
-        
-        # Read current config
-        with open(mkdocs_yml, 'r') as f:
-            content = f.read()
+        content = mkdocs[1]
         
         # Convert SSH URLs to HTTPS
-        ssh_pattern = r'git@([^:]+):([^/]+)/([^.]+)\.git'
-        https_replacement = r'https://\\1/\\2/\\3'
+        if 'git@' not in content:
+            return False
         
-        new_content = re.sub(ssh_pattern, https_replacement, content)
+        new_content = "".join(
+            _ssh_git_url_to_https(line) if 'git@' in line else line
+            for line in content.splitlines(keepends=True)
+        )
         
         if new_content != content:
-            with open(mkdocs_yml, 'w') as f:
-                f.write(new_content)
+            self._save_mkdocs_yml(new_content)
             return True
         
         return False
     
     def _fix_mkdocs_missing_directory(self) -> bool:
         """Fix missing MkDocs directory issues."""
-        docs_dir = self.project_root / "DOCS"
-        if not docs_dir.exists():
+        mkdocs = self._load_mkdocs_yml()
+        if mkdocs is None:
             return False
         
-        mkdocs_yml = docs_dir / "mkdocs.yml"
-        if not mkdocs_yml.exists():
-            return False
+        docs_dir = mkdocs[0].parent
         
         # Check if docs subdirectory exists
         docs_subdir = docs_dir / "docs"
@@ -393,24 +664,26 @@ class CIMonitor:
     
     def commit_and_push_fixes(self, commit_message: str) -> bool:
         """Commit and push fixes to repository."""
+        git = ['git', '-C', str(self.project_root)]
         try:
             # Stage changes
-            subprocess.run(['git', 'add', '-A'], check=True, cwd=self.project_root)
+            subprocess.run(git + ['add', '-A'], check=True)
             
-            # Check if there are changes to commit
-            result = subprocess.run(['git', 'diff', '--staged', '--quiet'], 
-                                  cwd=self.project_root, capture_output=True)
-            
-            if result.returncode == 0:
-                print("No changes to commit")
-                return False
-            
-            # Commit changes
-            subprocess.run(['git', 'commit', '-m', commit_message], 
-                          check=True, cwd=self.project_root)
+            # Commit changes; only probe the index when the commit fails, to
+            # tell "nothing to commit" apart from a real error
+            result = subprocess.run(git + ['commit', '-m', commit_message],
+                                    stdout=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                staged = subprocess.run(git + ['diff', '--staged', '--quiet'], capture_output=True)
+                if staged.returncode == 0:
+                    print("No changes to commit")
+                    return False
+                print(result.stdout, end='')
+                raise subprocess.CalledProcessError(result.returncode, result.args)
+            print(result.stdout, end='')
             
             # Push changes
-            subprocess.run(['git', 'push'], check=True, cwd=self.project_root)
+            subprocess.run(git + ['push'], check=True)
             
             return True
             
@@ -421,6 +694,7 @@ class CIMonitor:
     def wait_for_build(self, repo_id: int, commit_sha: str, timeout: int = 300) -> Optional[Dict]:
         """Wait for a build to complete for a specific commit."""
         start_time = time.time()
+        delay = _POLL_INITIAL_DELAY
         
         print(f"Waiting for build to start for commit {commit_sha[:8]}...")
         
@@ -435,17 +709,30 @@ class CIMonitor:
                     return build
                 elif status in ['pending', 'running']:
                     print("Build in progress...")
-                    time.sleep(10)
+                    if status == 'running':
+                        # A running build takes a while; don't poll it every few seconds
+                        delay = max(delay, _POLL_RUNNING_DELAY)
                 else:
                     print(f"Unknown build status: {status}")
-                    time.sleep(10)
             else:
                 print("Build not found yet, waiting...")
-                time.sleep(10)
+            
+            remaining = timeout - (time.time() - start_time)
+            time.sleep(max(0.0, min(delay, remaining)))
+            delay = min(_POLL_MAX_DELAY, delay * _POLL_BACKOFF)
         
         print(f"Timeout waiting for build to complete")
         return None
     
+    def _get_issue_manager(self):
+        """Load issue-mgr.py in-process on first use and return its IssueManager."""
+        if self._issue_manager is None:
+            spec = importlib.util.spec_from_file_location("issue_mgr", self.issue_mgr_path)
+            issue_mgr = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(issue_mgr)
+            self._issue_manager = issue_mgr.IssueManager(str(self.project_root))
+        return self._issue_manager
+    
     def _create_ci_failure_issue(self, build_info: Dict, logs: Dict[str, str] = None) -> Optional[int]:
         """Create an Issue for CI build failure with detailed information.
         
@@ -468,124 +755,87 @@ class CIMonitor:
             
             # Generate comprehensive Issue description
             commit_info = build_info.get('commit', {})
-            description_parts = [
-                "## Build Failure Report",
-                "",
-                f"**Status:** {build_info.get('status', 'unknown')}",
-                f"**Build Number:** #{build_number}",
-                f"**Commit SHA:** {commit_info.get('sha', 'unknown')}",
-                f"**Branch:** {commit_info.get('branch', 'unknown')}",
-                f"**Started:** {build_info.get('started', 'unknown')}",
-                f"**Finished:** {build_info.get('finished', 'unknown')}",
-                "",
-                f"## Commit Details",
-                f"**Message:** {commit_info.get('message', 'unknown')}",
-                f"**Author:** {commit_info.get('author', 'unknown')}",
-                "",
-                f"## Build Steps Status"
-            ]
-            
-            # Add step status information
             steps = build_info.get('steps', [])
-            failed_steps = []
             
+            # One pass over the steps for the status lines and the severity inputs
+            step_lines = []
+            failed_steps = []
+            security_failed = False
+            only_lint_docs_failed = True
             for step in steps:
                 step_name = step.get('name', 'unknown')
                 step_status = step.get('state', 'unknown')
-                step_exit_code = step.get('exit_code', 'unknown')
-                
-                if step_status == 'success':
-                    icon = "✅"
-                elif step_status == 'failure':
-                    icon = "❌"
+                step_lines.append(
+                    f"\n- {_STEP_STATUS_ICONS.get(step_status, '⏸️')} **{step_name}**: "
+                    f"{step_status} (exit code: {step.get('exit_code', 'unknown')})"
+                )
+                if step_status == 'failure':
                     failed_steps.append(step_name)
-                else:
-                    icon = "⏸️"
-                
-                description_parts.append(f"- {icon} **{step_name}**: {step_status} (exit code: {step_exit_code})")
+                    name_lower = step_name.lower()
+                    if 'security' in name_lower:
+                        security_failed = True
+                    if 'lint' not in name_lower and 'docs' not in name_lower:
+                        only_lint_docs_failed = False
             
             # Add build logs summary if available
+            failed_details = ""
             if logs:
-                description_parts.extend([
-                    "",
-                    "## Failed Steps Details"
-                ])
-                
+                details = ["\n\n## Failed Steps Details"]
                 for step_name in failed_steps:
-                    if step_name in logs and logs[step_name]:
-                        log_content = logs[step_name]
+                    log_content = logs.get(step_name)
+                    if log_content:
                         # Truncate very long logs for the Issue description
                         if len(log_content) > 1000:
                             log_content = log_content[:1000] + "\n... (truncated)"
-                        
-                        description_parts.extend([
-                            f"",
-                            f"### {step_name} Output",
-                            "```",
-                            log_content.strip(),
-                            "```"
-                        ])
-            
-            description_parts.extend([
-                "",
-                "## Next Steps",
-                "1. Review the build logs above for specific error details",
-                "2. Identify the root cause of the failure",
-                "3. Apply appropriate fixes",
-                "4. Re-run the build to verify the fix",
-                "",
-                f"## Build URL",
-                f"[View full build details]({self.woodpecker_base_url}/repos/{build_info.get('repo_id', 'unknown')}/build/{build_number})",
-                "",
-                "---",
-                "*Auto-created by CI Monitor on build failure*"
-            ])
-            
-            description = "\n".join(description_parts)
+                        details.append(f"\n\n### {step_name} Output\n```\n{log_content.strip()}\n```")
+                failed_details = "".join(details)
+            
+            description = _FAILURE_ISSUE_TEMPLATE.format(
+                status=build_info.get('status', 'unknown'),
+                build_number=build_number,
+                commit_sha=commit_info.get('sha', 'unknown'),
+                branch=commit_info.get('branch', 'unknown'),
+                started=build_info.get('started', 'unknown'),
+                finished=build_info.get('finished', 'unknown'),
+                message=commit_info.get('message', 'unknown'),
+                author=commit_info.get('author', 'unknown'),
+                step_lines="".join(step_lines),
+                failed_details=failed_details,
+                build_url=f"{self.woodpecker_base_url}/repos/{build_info.get('repo_id', 'unknown')}/build/{build_number}"
+            )
             
             # Determine severity based on failure type
             severity = "P1"  # Default to high priority for CI failures
             
             # Critical if security step failed
-            if any('security' in step.get('name', '').lower() for step in steps if step.get('state') == 'failure'):
+            if security_failed:
                 severity = "P0"
             # Medium if only lint/docs failed
-            elif all('lint' in step.get('name', '').lower() or 'docs' in step.get('name', '').lower() 
-                     for step in steps if step.get('state') == 'failure'):
+            elif only_lint_docs_failed:
                 severity = "P2"
             
             # Create the Issue
-            cmd = [
-                "python3", str(self.issue_mgr_path), "new",
-                "--type", "bug",
-                "--title", title,
-                "--description", description,
-                "--severity", severity,
-                "--environment", f"Woodpecker CI Build #{build_number}",
-                "--steps", "1. Commit changes to repository\n2. CI build triggers automatically\n3. Build fails with errors",
-                "--expected", "Build should complete successfully with all steps passing",
-                "--actual", f"Build failed with status: {build_info.get('status', 'unknown')}"
-            ]
+            issue = self._get_issue_manager().create_issue(
+                issue_type="bug",
+                title=title,
+                description=description,
+                severity=severity,
+                environment=f"Woodpecker CI Build #{build_number}",
+                steps="1. Commit changes to repository\n2. CI build triggers automatically\n3. Build fails with errors",
+                expected="Build should complete successfully with all steps passing",
+                actual=f"Build failed with status: {build_info.get('status', 'unknown')}"
+            )
             
-            # Execute Issue creation
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            issue_id = issue.get('number')
+            if issue_id is None:
+                print("Issue created but couldn't read Issue ID")
+                return None
             
-            # Parse Issue ID from output
-            for line in result.stdout.strip().split('\n'):
-                if line.startswith("Created issue #"):
-                    issue_match = re.search(r'#(\d+)', line)
-                    if issue_match:
-                        issue_id = int(issue_match.group(1))
-                        print(f"📋 Created Issue #{issue_id} for build failure: {title}")
-                        return issue_id
+            print(f"📋 Created Issue #{issue_id} for build failure: {title}")
+            return issue_id
             
-            print("Issue created but couldn't parse Issue ID")
-            return None
-            
-        except subprocess.CalledProcessError as e:
+        except ValueError as e:
             print(f"Error creating CI failure Issue: {e}")
-            print(f"stdout: {e.stdout}")
-            print(f"stderr: {e.stderr}")
             return None
         except Exception as e:
             print(f"Unexpected error creating CI failure Issue: {e}")
@@ -612,67 +862,39 @@ class CIMonitor:
             try:
                 title = f"CI Issue: {issue['description']}"
                 
-                description_parts = [
-                    "## Problem Description",
-                    issue['description'],
-                    "",
-                    "## Build Context",
-                    f"- **Build Step:** {issue['step']}",
-                    f"- **Issue Type:** {issue['type']}",
-                    f"- **Build Number:** #{build_info.get('number', 'unknown')}",
-                    f"- **Commit:** {build_info.get('commit', {}).get('sha', 'unknown')[:8]}",
-                    "",
-                    "## Suggested Fix",
-                    issue['fix'],
-                    "",
-                    "## Reproduction Steps",
-                    f"1. Make a commit that triggers CI",
-                    f"2. Wait for build to reach the '{issue['step']}' step",
-                    f"3. Observe the failure pattern",
-                    "",
-                    "## Expected Behavior",
-                    f"The '{issue['step']}' step should complete successfully",
-                    "",
-                    "## Actual Behavior",
-                    f"The '{issue['step']}' step fails with: {issue['description']}",
-                    "",
-                    "---",
-                    "*Auto-created by CI Monitor issue analysis*"
-                ]
-                
-                description = "\n".join(description_parts)
+                description = _BUG_REPORT_ISSUE_TEMPLATE.format(
+                    description=issue['description'],
+                    step=issue['step'],
+                    type=issue['type'],
+                    build_number=build_info.get('number', 'unknown'),
+                    commit=build_info.get('commit', {}).get('sha', 'unknown')[:8],
+                    fix=issue['fix']
+                )
                 
                 # Determine severity
                 severity = "P2"  # Most CI configuration issues are medium
-                if 'security' in issue['step'].lower():
+                step_lower = issue['step'].lower()
+                if 'security' in step_lower:
                     severity = "P0"
-                elif 'test' in issue['step'].lower() or 'build' in issue['step'].lower():
+                elif 'test' in step_lower or 'build' in step_lower:
                     severity = "P1"
                 
                 # Create the specific bug Issue
-                cmd = [
-                    "python3", str(self.issue_mgr_path), "new",
-                    "--type", "bug", 
-                    "--title", title,
-                    "--description", description,
-                    "--severity", severity,
-                    "--environment", f"Woodpecker CI - {issue['step']} step",
-                    "--steps", f"1. Trigger CI build\n2. Wait for {issue['step']} step\n3. Observe specific failure",
-                    "--expected", f"{issue['step']} step completes successfully",
-                    "--actual", f"{issue['step']} step fails: {issue['description']}"
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                created = self._get_issue_manager().create_issue(
+                    issue_type="bug",
+                    title=title,
+                    description=description,
+                    severity=severity,
+                    environment=f"Woodpecker CI - {issue['step']} step",
+                    steps=f"1. Trigger CI build\n2. Wait for {issue['step']} step\n3. Observe specific failure",
+                    expected=f"{issue['step']} step completes successfully",
+                    actual=f"{issue['step']} step fails: {issue['description']}"
+                )
                 
-                # Parse Issue ID
-                for line in result.stdout.strip().split('\n'):
-                    if line.startswith("Created issue #"):
-                        issue_match = re.search(r'#(\d+)', line)
-                        if issue_match:
-                            issue_id = int(issue_match.group(1))
-                            created_issues.append(issue_id)
-                            print(f"🐛 Created specific Bug #{issue_id}: {issue['description']}")
-                            break
+                issue_id = created.get('number')
+                if issue_id is not None:
+                    created_issues.append(issue_id)
+                    print(f"🐛 Created specific Bug #{issue_id}: {issue['description']}")
                 
             except Exception as e:
                 print(f"Error creating specific bug report for {issue['type']}: {e}")
@@ -750,9 +972,11 @@ class CIMonitor:
                 
                 if issues:
                     print(f"\\nFound {len(issues)} issue(s):")
-                    for i, issue in enumerate(issues, 1):
-                        print(f"  {i}. {issue['description']} (Step: {issue['step']})")
-                        print(f"     Fix: {issue['fix']}")
+                    sys.stdout.write("".join(
+                        f"  {i}. {issue['description']} (Step: {issue['step']})\n"
+                        f"     Fix: {issue['fix']}\n"
+                        for i, issue in enumerate(issues, 1)
+                    ))
                     
                     if auto_fix:
                         print("\\nAttempting automatic fixes...")
@@ -875,6 +1099,7 @@ Examples:
         parser.print_help()
         return
     
+    monitor = None
     try:
         monitor = CIMonitor()
         
@@ -883,11 +1108,13 @@ Examples:
             if 'error' in status:
                 print(f"Error: {status['error']}")
             else:
-                print(f"Repository: {status['repository']}")
                 build = status['latest_build']
-                print(f"Latest build: #{build['number']} - {build['status']}")
-                print(f"Commit: {build['commit']} - {build['message']}")
-                print(f"URL: {build['url']}")
+                sys.stdout.write(
+                    f"Repository: {status['repository']}\n"
+                    f"Latest build: #{build['number']} - {build['status']}\n"
+                    f"Commit: {build['commit']} - {build['message']}\n"
+                    f"URL: {build['url']}\n"
+                )
         
         elif args.latest:
             create_issues = not args.no_create_issues
@@ -903,6 +1130,9 @@ Examples:
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if monitor is not None:
+            monitor.close()
 
 
 if __name__ == "__main__":
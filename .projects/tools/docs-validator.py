@@ -19,10 +19,38 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Set DOCS_VALIDATOR_USE_RE2=1 to match task completion patterns with RE2
+# (google-re2), which runs in linear time on any commit message
+_completion_re = re
+if os.environ.get("DOCS_VALIDATOR_USE_RE2") == "1":
+    try:
+        import re2 as _completion_re
+    except ImportError:
+        pass
+
 
 class DocsValidator:
     """Validates documentation compliance in CI pipeline."""
     
+    # Files that require documentation updates: Python code and configuration
+    # (incl. project.yaml), plus requirements*.txt dependency files
+    _DOC_REQUIRING_SUFFIXES = ('.py', '.yaml', '.yml', '.json')
+    
+    # Files that don't require documentation updates: git internals, task and
+    # bug files, task/bug indexes, Claude context files, plus test*.py tests
+    _DOC_EXEMPT_PREFIXES = ('.git', 'TASKS/', 'BUGS/')
+    _DOC_EXEMPT_SUFFIXES = ('TODO.md', 'BUGS.md', 'CLAUDE.md')
+    
+    # Completion markers lead the subject, so only this much of it is scanned
+    _SUBJECT_SCAN_CHARS = 200
+    
+    # Documentation files, in the order they are reported as missing
+    _DOC_FILES = (
+        "README.md",
+        "DOCS/docs/getting-started.md",
+        "DOCS/docs/api.md",
+    )
+    
     def __init__(self, project_root: str = None):
         """Initialize documentation validator.
         
@@ -33,6 +61,44 @@ class DocsValidator:
         self.docs_dir = self.project_root / "DOCS"
         self.readme_file = self.project_root / "README.md"
         
+        # git command prefix bound to the project, built once
+        self._git = ["git", "-C", str(self.project_root)]
+        
+        # (commit message, changed files) by commit ref and full SHA
+        self._commit_cache: Dict[str, Tuple[str, List[str]]] = {}
+        
+        # Patterns indicating task completion, matched at the start of the subject
+        # (inline (?i) since re2 doesn't take re's flag arguments)
+        self._completion_res = [_completion_re.compile(p) for p in (
+            r"(?i)^Complete TASK-(\d+)",
+            r"(?i)^Finish TASK-(\d+)",
+            r"(?i)^TASK-(\d+):.*complete",
+            r"(?i)^TASK-(\d+):.*finished"
+        )]
+        
+    def _get_commit_info(self, commit_sha: str = "HEAD") -> Tuple[str, List[str]]:
+        """Get commit message and changed files for specified commit.
+        
+        Results are memoized under both the given ref and the full SHA, so a
+        commit validated as HEAD isn't queried again by the pattern check.
+        
+        Args:
+            commit_sha: Commit SHA to check (default: HEAD)
+            
+        Returns:
+            Tuple of (commit message, changed file paths)
+        """
+        commit_info = self._commit_cache.get(commit_sha)
+        if commit_info is None:
+            try:
+                commits = self._batch_get_commits([commit_sha])
+            except subprocess.CalledProcessError:
+                return "", []
+            if len(commits) != 1:
+                return "", []
+            commit_info = self._commit_cache[commit_sha] = next(iter(commits.values()))
+        return commit_info
+    
     def _get_commit_message(self, commit_sha: str = "HEAD") -> str:
         """Get commit message for specified commit.
         
@@ -42,16 +108,7 @@ class DocsValidator:
         Returns:
             Commit message
         """
-        try:
-            result = subprocess.run(
-                ["git", "show", "-s", "--format=%B", commit_sha],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return ""
+        return self._get_commit_info(commit_sha)[0]
     
     def _get_changed_files(self, commit_sha: str = "HEAD") -> List[str]:
         """Get list of files changed in specified commit.
@@ -62,36 +119,79 @@ class DocsValidator:
         Returns:
             List of changed file paths
         """
-        try:
-            result = subprocess.run(
-                ["git", "show", "--name-only", "--format=", commit_sha],
-                capture_output=True,
-                text=True,
-                check=True
+        return self._get_commit_info(commit_sha)[1]
+    
+    def _batch_get_commits(self, commit_shas: List[str]) -> Dict[str, Tuple[str, List[str]]]:
+        """Get commit messages and changed files for several commits in one git call.
+        
+        Commits already in the memo are not queried again.
+        
+        Args:
+            commit_shas: Commit SHAs to look up
+            
+        Returns:
+            Dictionary mapping full commit SHA to (commit message, changed file paths)
+            
+        Raises:
+            subprocess.CalledProcessError: If git fails
+        """
+        commits = {sha: self._commit_cache[sha] for sha in commit_shas if sha in self._commit_cache}
+        missing = [sha for sha in commit_shas if sha not in commits]
+        if not missing:
+            return commits
+        
+        commits.update(self._git_log_commits(["--no-walk=unsorted", *missing]))
+        return commits
+    
+    def _git_log_commits(self, log_args: List[str]) -> Dict[str, Tuple[str, List[str]]]:
+        """Run git log and collect message and changed files of each listed commit.
+        
+        Results are added to the commit memo.
+        
+        Args:
+            log_args: Revision arguments for git log
+            
+        Returns:
+            Dictionary mapping full commit SHA to (commit message, changed file
+            paths), in git log order
+            
+        Raises:
+            subprocess.CalledProcessError: If git fails
+        """
+        # Each record is "\x1e<sha>\x1f<message>\0" followed by the NUL-terminated
+        # changed paths; --cc lists merge commit files the way `git show` does
+        result = subprocess.run(
+            [*self._git, "log", "-z", "--cc", "--name-only", "--format=%x1e%H%x1f%B", *log_args],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        
+        commits = {}
+        for record in result.stdout.split('\x1e')[1:]:
+            commit_sha, _, rest = record.partition('\x1f')
+            message, _, files = rest.partition('\0')
+            commits[commit_sha] = self._commit_cache[commit_sha] = (
+                message.strip(),
+                [f.strip() for f in files.split('\0') if f.strip()]
             )
-            return [f.strip() for f in result.stdout.strip().split('\n') if f.strip()]
-        except subprocess.CalledProcessError:
-            return []
+        return commits
     
     def _is_task_completion_commit(self, commit_message: str) -> Tuple[bool, Optional[str]]:
         """Check if commit represents task completion.
         
+        Only the subject line is checked; completion commits lead with
+        "Complete TASK-n", "Finish TASK-n" or "TASK-n: ... complete/finished".
+        
         Args:
             commit_message: Commit message to analyze
             
         Returns:
             Tuple of (is_completion, task_id)
         """
-        # Look for patterns indicating task completion
-        completion_patterns = [
-            r"Complete TASK-(\d+)",
-            r"Finish TASK-(\d+)",
-            r"TASK-(\d+):.*complete",
-            r"TASK-(\d+):.*finished"
-        ]
-        
-        for pattern in completion_patterns:
-            match = re.search(pattern, commit_message, re.IGNORECASE)
+        subject = commit_message.partition('\n')[0][:self._SUBJECT_SCAN_CHARS]
+        for completion_re in self._completion_res:
+            match = completion_re.match(subject)
             if match:
                 return True, match.group(1)
         
@@ -106,39 +206,25 @@ class DocsValidator:
         Returns:
             True if documentation updates are required
         """
-        # Files that require documentation updates
-        doc_requiring_patterns = [
-            r'\.py$',           # Python code changes
-            r'requirements.*\.txt$',  # Dependency changes
-            r'\.yaml$',         # Configuration changes
-            r'\.yml$',          # Configuration changes
-            r'\.json$',         # Configuration changes
-            r'project\.yaml$',  # Project configuration
-        ]
-        
-        # Files that don't require documentation updates
-        doc_exempt_patterns = [
-            r'^\.git',          # Git internals
-            r'^TASKS/',         # Task files
-            r'^BUGS/',          # Bug files  
-            r'TODO\.md$',       # Task index
-            r'BUGS\.md$',       # Bug index
-            r'CLAUDE\.md$',     # Claude context files
-            r'test.*\.py$',     # Test files
-            r'.*_test\.py$',    # Test files
-        ]
-        
+        # The requiring test is a cheap suffix check that most files fail, so it
+        # runs first; the exempt test only matters for files that pass it
         for file_path in changed_files:
-            # Skip exempt files
-            if any(re.search(pattern, file_path) for pattern in doc_exempt_patterns):
-                continue
-                
-            # Check if file requires documentation
-            if any(re.search(pattern, file_path) for pattern in doc_requiring_patterns):
+            if self._is_doc_requiring(file_path) and not self._is_doc_exempt(file_path):
                 return True
         
         return False
     
+    def _is_doc_requiring(self, file_path: str) -> bool:
+        """Check if a file is code or configuration whose changes need docs."""
+        return (file_path.endswith(self._DOC_REQUIRING_SUFFIXES)
+                or (file_path.endswith('.txt') and 'requirements' in file_path[:-4]))
+    
+    def _is_doc_exempt(self, file_path: str) -> bool:
+        """Check if a file is exempt from documentation requirements."""
+        return (file_path.startswith(self._DOC_EXEMPT_PREFIXES)
+                or file_path.endswith(self._DOC_EXEMPT_SUFFIXES)
+                or (file_path.endswith('.py') and 'test' in file_path[:-3]))
+    
     def _check_documentation_updated(self, changed_files: List[str]) -> Tuple[bool, List[str]]:
         """Check if documentation files were updated.
         
@@ -148,39 +234,45 @@ class DocsValidator:
         Returns:
             Tuple of (docs_updated, missing_docs)
         """
-        doc_files = [
-            "README.md",
-            "DOCS/docs/getting-started.md",
-            "DOCS/docs/api.md",
-        ]
-        
-        updated_docs = []
-        missing_docs = []
-        
-        for doc_file in doc_files:
-            if doc_file in changed_files:
-                updated_docs.append(doc_file)
-            else:
-                missing_docs.append(doc_file)
+        changed = set(changed_files)
+        missing_docs = [doc_file for doc_file in self._DOC_FILES if doc_file not in changed]
         
         # At least one documentation file should be updated
-        docs_updated = len(updated_docs) > 0
+        docs_updated = len(missing_docs) < len(self._DOC_FILES)
         
         return docs_updated, missing_docs
     
-    def validate_commit(self, commit_sha: str = "HEAD") -> Dict:
+    def validate_commit(self, commit_sha: str = "HEAD",
+                        commit_info: Optional[Tuple[str, List[str]]] = None,
+                        fast: bool = False) -> Dict:
         """Validate documentation compliance for a specific commit.
         
         Args:
             commit_sha: Commit SHA to validate
+            commit_info: (commit message, changed files) if already fetched,
+                e.g. by _git_log_commits; queried from git otherwise
+            fast: Skip the documentation checks for commits that aren't task
+                completions; their result then has no requires_documentation,
+                documentation_updated or missing_docs entries
             
         Returns:
             Validation result dictionary
         """
-        commit_message = self._get_commit_message(commit_sha)
-        changed_files = self._get_changed_files(commit_sha)
+        commit_message, changed_files = commit_info or self._get_commit_info(commit_sha)
         
         is_task_completion, task_id = self._is_task_completion_commit(commit_message)
+        if fast and not is_task_completion:
+            return {
+                "commit_sha": commit_sha,
+                "commit_message": commit_message[:100] + "..." if len(commit_message) > 100 else commit_message,
+                "is_task_completion": False,
+                "task_id": None,
+                "changed_files": changed_files,
+                "validation_passed": True,
+                "warnings": [],
+                "errors": []
+            }
+        
         requires_docs = self._requires_documentation_update(changed_files)
         docs_updated, missing_docs = self._check_documentation_updated(changed_files)
         
@@ -223,25 +315,13 @@ class DocsValidator:
             Validation result dictionary
         """
         try:
-            # Get last 10 commits
-            result = subprocess.run(
-                ["git", "log", "--oneline", "-10", "--format=%H %s"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    parts = line.split(' ', 1)
-                    if len(parts) == 2:
-                        commits.append((parts[0], parts[1]))
+            # Get last 10 commits with their messages and changed files
+            commits = self._git_log_commits(["-10"])
             
             task_completion_issues = []
             
-            for commit_sha, commit_msg in commits:
-                validation = self.validate_commit(commit_sha)
+            for commit_sha, commit_info in commits.items():
+                validation = self.validate_commit(commit_sha, commit_info, fast=True)
                 if validation["is_task_completion"] and not validation["validation_passed"]:
                     task_completion_issues.append(validation)
             